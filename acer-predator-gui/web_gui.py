@@ -8,98 +8,358 @@ import sys
 import os
 import json
 import threading
+import time
+import zlib
+import gzip
 import webbrowser
-from pathlib import Path
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
-import socketserver
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 
 # Add src directory to Python path
-current_dir = Path(__file__).parent
-src_dir = current_dir / "src"
-sys.path.insert(0, str(src_dir))
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(current_dir, "src")
+sys.path.insert(0, src_dir)
 
 from core.rgb_controller import RGBController
 
+# orjson is optional; fall back to the stdlib json module when it is missing
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+    JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+    
+    def json_dumps(data):
+        """Serialize data to UTF-8 encoded JSON bytes"""
+        return JSON_ENCODER.encode(data).encode()
+
+# rjsmin is optional; without it the page script is served exactly as written
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+# Age after which a poll of the last known status queues a fresh controller read
+STATUS_CACHE_SECONDS = 0.25
+
+# Age after which a poll waits for a fresh read instead (the page polls every 5 s)
+STATUS_MAX_AGE_SECONDS = 5.0
+
+# Scalar /api/set_mode fields passed straight through to set_rgb_mode
+SET_MODE_KEYS = ('brightness', 'speed', 'direction', 'zone')
+
+# RGB mode attributes exposed by /api/modes
+MODE_FIELDS = ('id', 'name', 'description', 'supports_color',
+               'supports_zone', 'supports_speed', 'supports_direction')
+
+# Seconds an HTTP request waits on the RGB controller before giving up
+CONTROLLER_TIMEOUT = 2.0
+
+# Largest POST body accepted; the API only takes small JSON objects
+MAX_BODY_SIZE = 4096
+
+# Seconds between keep-alive comments on an idle /api/events stream
+EVENTS_KEEPALIVE_SECONDS = 15
+
+# Seconds between status reads while /api/events streams are open, so changes
+# made outside the GUI (facer_rgb.py, keyboard.py) are pushed too
+EVENTS_REFRESH_SECONDS = 2
+
+# Pre-serialized bodies for the POST handlers' common replies
+SUCCESS_PAYLOAD = b'{"success":true}'
+FAILURE_PAYLOAD = b'{"success":false}'
+
+# Color swatches offered under the color picker as (hex color, name)
+PRESET_COLORS = [
+    ('#83B81A', 'Acer Green'),
+    ('#ff0000', 'Red'),
+    ('#00ff00', 'Green'),
+    ('#0000ff', 'Blue'),
+    ('#ffff00', 'Yellow'),
+    ('#ff00ff', 'Magenta'),
+    ('#00ffff', 'Cyan'),
+    ('#ffffff', 'White'),
+]
+
+# JSON bodies smaller than this are sent uncompressed
+GZIP_MIN_SIZE = 512
+
+def make_etag(payload):
+    """Build an ETag for a response body"""
+    return '"%08x"' % zlib.crc32(payload)
+
+def gzip_etag(etag):
+    """Build the ETag of the gzip encoded copy of a body tagged etag"""
+    return etag[:-1] + '-gz"'
+
+class SetModeQueue:
+    """Apply RGB changes on a background thread, keeping only the latest ones
+    
+    Static mode colors each zone separately, so pending static changes are
+    kept per zone; a change in any other mode replaces everything pending.
+    The outcome of the latest batch is kept in last_error for /api/status.
+    """
+    
+    def __init__(self, rgb_controller, executor, on_applied=None):
+        self.rgb_controller = rgb_controller
+        self.executor = executor
+        self.on_applied = on_applied
+        self.last_error = None
+        self.pending = {}
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name='rgb-writer', daemon=True)
+        self.thread.start()
+    
+    def submit(self, mode, kwargs):
+        """Queue an RGB change, dropping pending changes it supersedes"""
+        self.submit_many([(mode, kwargs)])
+    
+    def submit_many(self, changes):
+        """Queue several (mode, kwargs) changes so they are written as one batch"""
+        with self.condition:
+            for mode, kwargs in changes:
+                if mode == 0:
+                    key = kwargs.get('zone')
+                    self.pending.pop(key, None)
+                else:
+                    key = None
+                    self.pending.clear()
+                self.pending[key] = (mode, kwargs)
+            self.condition.notify()
+    
+    def run(self):
+        """Worker loop writing queued changes to the RGB controller"""
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                changes = list(self.pending.values())
+                self.pending.clear()
+            
+            # Write on the controller thread so device access stays serial
+            self.executor.submit(self.apply, changes).result()
+    
+    def apply(self, changes):
+        """Write a batch of RGB changes to the controller"""
+        errors = []
+        for mode, kwargs in changes:
+            try:
+                if not self.rgb_controller.set_rgb_mode(mode, **kwargs):
+                    errors.append(f"controller rejected mode {mode} settings")
+            except Exception as e:
+                print(f"❌ Failed to apply RGB settings: {e}")
+                errors.append(str(e) or type(e).__name__)
+        self.last_error = '; '.join(errors) or None
+        
+        if self.on_applied:
+            try:
+                self.on_applied()
+            except Exception as e:
+                print(f"❌ Failed to read RGB status: {e}")
+
 class RGBWebHandler(SimpleHTTPRequestHandler):
     """Web server handler for RGB control"""
     
-    def __init__(self, *args, rgb_controller=None, **kwargs):
-        self.rgb_controller = rgb_controller
-        super().__init__(*args, **kwargs)
+    # Keep connections open between the page's polls; every response sets Content-Length
+    protocol_version = 'HTTP/1.1'
+    
+    # Buffer writes so a response's headers and body go out in a single send();
+    # the server flushes wfile after each request
+    wbufsize = 64 * 1024
+    
+    # Serialized /api/modes response, filled in on first request
+    modes_payload = None
+    modes_etag = None
+    
+    # Last known /api/status response as (timestamp, payload, etag, status_version);
+    # only the controller thread reads the device for it, so polls never wait on hardware
+    status_cache = None
+    status_refresh_pending = False
+    
+    # Bumped whenever the stored status changes; /api/events streams wait on status_changed
+    status_version = 0
+    status_changed = threading.Condition()
+    
+    # RGBController shared by every request, set up by create_handler_class
+    rgb_controller = None
+    
+    # Single worker thread running all RGB controller calls, set up by create_handler_class
+    controller_executor = None
+    
+    # SetModeQueue applying /api/set_mode changes, set up by create_handler_class
+    set_mode_queue = None
+    
+    # Request path -> name of the method serving it
+    GET_ROUTES = {
+        '/': 'serve_main_page',
+        '/api/status': 'serve_status',
+        '/api/modes': 'serve_modes',
+        '/api/profiles': 'serve_profiles',
+        '/api/events': 'serve_events',
+    }
+    POST_ROUTES = {
+        '/api/set_mode': 'handle_set_mode',
+        '/api/set_all_zones': 'handle_set_all_zones',
+        '/api/save_profile': 'handle_save_profile',
+        '/api/load_profile': 'handle_load_profile',
+    }
     
     def do_GET(self):
         """Handle GET requests"""
-        parsed_path = urlparse(self.path)
-        
-        if parsed_path.path == '/':
-            self.serve_main_page()
-        elif parsed_path.path == '/api/status':
-            self.serve_status()
-        elif parsed_path.path == '/api/modes':
-            self.serve_modes()
-        elif parsed_path.path == '/api/profiles':
-            self.serve_profiles()
-        elif parsed_path.path.startswith('/api/'):
-            self.serve_api(parsed_path)
+        path = self.path.partition('?')[0]
+        route = self.GET_ROUTES.get(path)
+        
+        if route:
+            getattr(self, route)()
+        elif path.startswith('/api/'):
+            self.send_error(404)
         else:
             super().do_GET()
     
     def do_POST(self):
         """Handle POST requests for RGB control"""
-        parsed_path = urlparse(self.path)
-        
-        if parsed_path.path == '/api/set_mode':
-            self.handle_set_mode()
-        elif parsed_path.path == '/api/save_profile':
-            self.handle_save_profile()
-        elif parsed_path.path == '/api/load_profile':
-            self.handle_load_profile()
+        route = self.POST_ROUTES.get(self.path.partition('?')[0])
+        
+        if route:
+            getattr(self, route)()
         else:
+            # The unread request body would corrupt the next request on this connection
+            self.close_connection = True
             self.send_error(404)
     
     def serve_main_page(self):
         """Serve the main web GUI"""
-        html_content = self.generate_html()
+        compressed = self.accepts_gzip()
+        etag = HTML_GZIP_ETAG if compressed else HTML_ETAG
+        if self.not_modified(etag):
+            return
+        
+        body = HTML_GZIP if compressed else gzip.decompress(HTML_GZIP)
         
         self.send_response(200)
-        self.send_header('Content-type', 'text/html')
+        self.send_header('Content-type', 'text/html; charset=utf-8')
+        if compressed:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def accepts_gzip(self):
+        """Check whether the client accepts gzip encoded responses"""
+        # Weigh each coding by its q-value, so "gzip;q=0" refuses gzip
+        qualities = {}
+        for coding in self.headers.get('Accept-Encoding', '').split(','):
+            name, *params = coding.split(';')
+            quality = 1.0
+            for param in params:
+                key, _, value = param.partition('=')
+                if key.strip().lower() == 'q':
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            qualities[name.strip().lower()] = quality
+        
+        return qualities.get('gzip', qualities.get('*', 0.0)) > 0
+    
+    def not_modified(self, etag):
+        """Reply 304 if the client already holds the response tagged etag"""
+        if self.headers.get('If-None-Match') != etag:
+            return False
+        
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.send_header('Vary', 'Accept-Encoding')
         self.end_headers()
-        self.wfile.write(html_content.encode())
+        return True
     
     def serve_status(self):
         """Serve current RGB status as JSON"""
         try:
-            status = {
-                'connected': self.rgb_controller.is_device_available(),
-                'state': self.rgb_controller.get_current_state()
-            }
-            self.send_json(status)
+            _, payload, etag, _ = self.current_status()
+            self.send_json_payload(payload, etag=etag)
         except Exception as e:
             self.send_json({'error': str(e)}, 500)
     
+    def current_status(self):
+        """Return the last known status entry as (timestamp, payload, etag, version)"""
+        cached = self.status_cache
+        age = time.monotonic() - cached[0] if cached else None
+        if cached is None or age > STATUS_MAX_AGE_SECONDS:
+            # Nothing read recently, so wait for the controller rather than
+            # answer with state from before the previous poll
+            try:
+                self.call_controller(self.refresh_status)
+            except TimeoutError:
+                if cached is None:
+                    raise
+            return self.status_cache
+        if age > STATUS_CACHE_SECONDS:
+            # Answer with what is known now; the refresh reaches /api/events streams
+            self.schedule_status_refresh()
+        
+        return cached
+    
+    def serve_events(self):
+        """Stream the status as server-sent events, pushing each change"""
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        # The stream has no length, so the connection ends with it
+        self.close_connection = True
+        
+        try:
+            while True:
+                _, payload, _, version = self.current_status()
+                self.wfile.write(b'data: ' + payload + b'\n\n')
+                self.wfile.flush()
+                
+                changed = False
+                idle_since = time.monotonic()
+                while not changed:
+                    with self.status_changed:
+                        changed = self.status_changed.wait_for(
+                            lambda: self.status_version != version, EVENTS_REFRESH_SECONDS)
+                    if changed:
+                        break
+                    # Re-read the device in case something else changed it
+                    self.schedule_status_refresh()
+                    if time.monotonic() - idle_since >= EVENTS_KEEPALIVE_SECONDS:
+                        self.wfile.write(b': keep-alive\n\n')
+                        self.wfile.flush()
+                        idle_since = time.monotonic()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        except Exception as e:
+            print(f"❌ Status stream closed: {e}")
+    
     def serve_modes(self):
         """Serve available RGB modes"""
         try:
-            modes = []
-            for mode in self.rgb_controller.get_modes():
-                modes.append({
-                    'id': mode.id,
-                    'name': mode.name,
-                    'description': mode.description,
-                    'supports_color': mode.supports_color,
-                    'supports_zone': mode.supports_zone,
-                    'supports_speed': mode.supports_speed,
-                    'supports_direction': mode.supports_direction
-                })
-            self.send_json(modes)
+            # The mode list is fixed for the lifetime of the process, so serialize it once
+            handler_class = type(self)
+            if handler_class.modes_payload is None:
+                modes = [{field: getattr(mode, field) for field in MODE_FIELDS}
+                         for mode in self.call_controller(self.rgb_controller.get_modes)]
+                handler_class.modes_payload = json_dumps(modes)
+                handler_class.modes_etag = make_etag(handler_class.modes_payload)
+            
+            self.send_json_payload(self.modes_payload, etag=self.modes_etag)
         except Exception as e:
             self.send_json({'error': str(e)}, 500)
     
     def serve_profiles(self):
         """Serve saved profiles"""
         try:
-            profiles = self.rgb_controller.list_profiles()
+            profiles = self.call_controller(self.rgb_controller.list_profiles)
             self.send_json(profiles)
         except Exception as e:
             self.send_json({'error': str(e)}, 500)
@@ -107,69 +367,210 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
     def handle_set_mode(self):
         """Handle RGB mode setting"""
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode())
+            data = json_loads(self.read_body())
             
             mode = data.get('mode', 3)
-            kwargs = {}
-            
-            if 'brightness' in data:
-                kwargs['brightness'] = data['brightness']
-            if 'speed' in data:
-                kwargs['speed'] = data['speed']
-            if 'color' in data:
-                kwargs['color'] = tuple(data['color'])
-            if 'direction' in data:
-                kwargs['direction'] = data['direction']
-            if 'zone' in data:
-                kwargs['zone'] = data['zone']
-            
-            success = self.rgb_controller.set_rgb_mode(mode, **kwargs)
-            self.send_json({'success': success})
+            kwargs = self.set_mode_kwargs(data)
+            
+            # Applied asynchronously; the stored status is refreshed once the change is written
+            self.set_mode_queue.submit(mode, kwargs)
+            self.send_json_payload(SUCCESS_PAYLOAD, 202)
             
         except Exception as e:
             self.send_json({'error': str(e)}, 500)
     
+    def handle_set_all_zones(self):
+        """Handle applying one static color to several zones at once"""
+        try:
+            data = json_loads(self.read_body())
+            
+            kwargs = self.set_mode_kwargs(data)
+            zones = data.get('zones', [1, 2, 3, 4])
+            if not (isinstance(zones, list) and zones and
+                    all(type(zone) is int and 1 <= zone <= 4 for zone in zones)):
+                self.send_json({'error': 'zones must be a list of zone numbers from 1 to 4'}, 400)
+                return
+            
+            # Per-zone colors only exist in static mode; all zones go out as one batch
+            self.set_mode_queue.submit_many([(0, {**kwargs, 'zone': zone}) for zone in zones])
+            self.send_json_payload(SUCCESS_PAYLOAD, 202)
+            
+        except Exception as e:
+            self.send_json({'error': str(e)}, 500)
+    
+    def set_mode_kwargs(self, data):
+        """Build set_rgb_mode keyword arguments from a request body"""
+        kwargs = {}
+        for key in SET_MODE_KEYS:
+            value = data.get(key)
+            if value is not None:
+                kwargs[key] = value
+        if data.get('color') is not None:
+            kwargs['color'] = tuple(data['color'])
+        return kwargs
+    
     def handle_save_profile(self):
         """Handle profile saving"""
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode())
+            data = json_loads(self.read_body())
             
             name = data.get('name', 'New Profile')
-            success = self.rgb_controller.save_profile(name)
-            self.send_json({'success': success})
+            success = self.call_controller(self.rgb_controller.save_profile, name)
+            if not success:
+                self.send_json_payload(FAILURE_PAYLOAD)
+                return
             
         except Exception as e:
             self.send_json({'error': str(e)}, 500)
+            return
+        
+        # Include the updated list so the page does not have to fetch it again;
+        # the profile is saved either way, so a failed listing is not an error
+        try:
+            profiles = self.call_controller(self.rgb_controller.list_profiles)
+        except Exception as e:
+            print(f"❌ Failed to list profiles: {e}")
+            self.send_json_payload(SUCCESS_PAYLOAD)
+            return
+        self.send_json({'success': True, 'profiles': profiles})
     
     def handle_load_profile(self):
         """Handle profile loading"""
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode())
+            data = json_loads(self.read_body())
             
             name = data.get('name')
-            success = self.rgb_controller.load_profile(name)
-            self.send_json({'success': success})
+            success = self.call_controller(self.rgb_controller.load_profile, name)
+            if not success:
+                self.schedule_status_refresh()
+                self.send_json_payload(FAILURE_PAYLOAD)
+                return
             
         except Exception as e:
             self.send_json({'error': str(e)}, 500)
+            return
+        
+        # Include the new status so the page does not have to poll for it;
+        # the profile is loaded either way, so a failed read is not an error
+        try:
+            self.call_controller(self.refresh_status)
+        except Exception as e:
+            print(f"❌ Failed to read RGB status: {e}")
+            self.send_json_payload(SUCCESS_PAYLOAD)
+            return
+        self.send_json_payload(b'{"success":true,"status":' + self.status_cache[1] + b'}')
+    
+    def read_body(self):
+        """Read the request body, refusing anything over MAX_BODY_SIZE"""
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if not 0 <= length <= MAX_BODY_SIZE:
+            # The unread body would corrupt the next request on this connection
+            self.close_connection = True
+            raise ValueError(f"Content-Length must be between 0 and {MAX_BODY_SIZE} bytes")
+        return self.rfile.read(length) if length else b''
+    
+    def call_controller(self, method, *args):
+        """Run a controller call on the controller thread and wait for its result"""
+        future = self.controller_executor.submit(method, *args)
+        try:
+            return future.result(timeout=CONTROLLER_TIMEOUT)
+        except FutureTimeoutError:
+            # Don't let a call the client was told failed run later on
+            if future.cancel():
+                raise TimeoutError(f"RGB controller busy for over {CONTROLLER_TIMEOUT:g} s, "
+                                   "request dropped") from None
+            raise TimeoutError(f"RGB controller did not answer within {CONTROLLER_TIMEOUT:g} s, "
+                               "the request may still complete") from None
+    
+    @classmethod
+    def refresh_status(cls):
+        """Read the status from the controller and store it as the last known one
+        
+        Runs on the controller thread, after every write batch, whenever a
+        poll finds the stored status older than STATUS_CACHE_SECONDS and every
+        EVENTS_REFRESH_SECONDS while /api/events streams are open.
+        """
+        try:
+            status = {
+                'connected': cls.rgb_controller.is_device_available(),
+                'state': cls.rgb_controller.get_current_state(),
+                'last_error': cls.set_mode_queue.last_error
+            }
+            payload = json_dumps(status)
+            etag = make_etag(payload)
+            
+            with cls.status_changed:
+                if cls.status_cache is not None and cls.status_cache[2] == etag:
+                    cls.status_cache = (time.monotonic(), payload, etag, cls.status_version)
+                    return
+                cls.status_version += 1
+                cls.status_cache = (time.monotonic(), payload, etag, cls.status_version)
+                cls.status_changed.notify_all()
+        finally:
+            cls.status_refresh_pending = False
+    
+    @classmethod
+    def schedule_status_refresh(cls):
+        """Queue a status refresh on the controller thread unless one is already queued"""
+        with cls.status_changed:
+            if cls.status_refresh_pending:
+                return
+            cls.status_refresh_pending = True
+        cls.controller_executor.submit(cls.refresh_status)
     
     def send_json(self, data, status=200):
         """Send JSON response"""
+        self.send_json_payload(json_dumps(data), status)
+    
+    def send_json_payload(self, payload, status=200, etag=None):
+        """Send an already serialized JSON response, or 304 if etag matches"""
+        compressed = len(payload) > GZIP_MIN_SIZE and self.accepts_gzip()
+        if etag:
+            # Each encoding is its own representation and needs its own tag
+            if compressed:
+                etag = gzip_etag(etag)
+            if self.not_modified(etag):
+                return
+        if compressed:
+            payload = gzip.compress(payload, compresslevel=1)
+        
         self.send_response(status)
         self.send_header('Content-type', 'application/json')
+        if compressed:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(payload)))
         self.send_header('Access-Control-Allow-Origin', '*')
+        if etag:
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('ETag', etag)
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(payload)
     
-    def generate_html(self):
-        """Generate the web GUI HTML"""
-        return '''<!DOCTYPE html>
+def preset_color_html():
+    """Render the preset color swatches"""
+    return ''.join(
+        f'                        <div class="preset-color" style="background: {color}" '
+        f'data-color="{color}" title="{name}"></div>\n'
+        for color, name in PRESET_COLORS
+    )
+
+def minify_html(html):
+    """Minify the page script, which is most of the page, when rjsmin is installed"""
+    if rjsmin is None:
+        return html
+    head, tag, rest = html.partition('<script>')
+    script, end_tag, tail = rest.partition('</script>')
+    if not end_tag:
+        return html
+    return head + tag + rjsmin.jsmin(script) + end_tag + tail
+
+def generate_html():
+    """Generate the web GUI HTML"""
+    return '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -475,15 +876,7 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
                     <input type="color" class="color-picker" id="colorPicker" value="#32ff32">
                     
                     <div class="preset-colors">
-                        <div class="preset-color" style="background: #83B81A" data-color="#83B81A" title="Acer Green"></div>
-                        <div class="preset-color" style="background: #ff0000" data-color="#ff0000" title="Red"></div>
-                        <div class="preset-color" style="background: #00ff00" data-color="#00ff00" title="Green"></div>
-                        <div class="preset-color" style="background: #0000ff" data-color="#0000ff" title="Blue"></div>
-                        <div class="preset-color" style="background: #ffff00" data-color="#ffff00" title="Yellow"></div>
-                        <div class="preset-color" style="background: #ff00ff" data-color="#ff00ff" title="Magenta"></div>
-                        <div class="preset-color" style="background: #00ffff" data-color="#00ffff" title="Cyan"></div>
-                        <div class="preset-color" style="background: #ffffff" data-color="#ffffff" title="White"></div>
-                    </div>
+''' + preset_color_html() + '''                    </div>
                 </div>
                 
                 <div class="slider-group">
@@ -537,34 +930,79 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
     <script>
         let currentMode = 3;
         let rgbModes = [];
+        let rgbModeById = new Map();
         let currentDirection = 1;
         let currentZone = 1;
+        const profileButtons = new Map();
+        let lastIndicator = null;
+        
+        // Controls being dragged right now; status pushes leave these alone
+        const dragging = new Set();
+        const zoneElements = [];
+        
+        // Elements used by the handlers below, looked up once in init()
+        const els = {};
+        const ELEMENT_IDS = [
+            'modeGrid', 'profilesList', 'profileName', 'statusDot', 'statusText',
+            'currentMode', 'currentBrightness', 'brightnessSlider', 'brightnessValue',
+            'speedSlider', 'speedValue', 'colorPicker', 'speedGroup', 'colorGroup',
+            'directionGroup', 'zoneGroup'
+        ];
+        
+        // Convert between #rrggbb strings and [r, g, b] through a single 24-bit integer
+        function rgbToHex(r, g, b) {
+            return '#' + ((1 << 24) | (r << 16) | (g << 8) | b).toString(16).slice(1);
+        }
+        
+        function hexToRgb(hex) {
+            const n = parseInt(hex.slice(1), 16);
+            return [(n >> 16) & 255, (n >> 8) & 255, n & 255];
+        }
         
         // Initialize the web interface
         async function init() {
+            for (const id of ELEMENT_IDS) {
+                els[id] = document.getElementById(id);
+            }
+            for (let i = 1; i <= 4; i++) {
+                zoneElements.push(document.getElementById(`zone${i}`));
+            }
+            
             await loadModes();
             await loadProfiles();
             await updateStatus();
             setupEventListeners();
             
-            // Update status periodically
-            setInterval(updateStatus, 5000);
+            // The server pushes status changes; polling is only a fallback
+            const pushed = watchStatus();
+            
+            // Update status periodically, but only while the tab is visible
+            setInterval(() => {
+                if (document.visibilityState === 'visible') updateStatus();
+            }, pushed ? 30000 : 5000);
+            
+            // Refresh straight away when the tab comes back into view
+            document.addEventListener('visibilitychange', () => {
+                if (document.visibilityState === 'visible') updateStatus();
+            });
         }
         
         async function loadModes() {
             try {
                 const response = await fetch('/api/modes');
                 rgbModes = await response.json();
+                rgbModeById = new Map(rgbModes.map(m => [m.id, m]));
                 
-                const modeGrid = document.getElementById('modeGrid');
+                const modeGrid = els.modeGrid;
                 modeGrid.innerHTML = '';
                 
                 rgbModes.forEach(mode => {
                     const btn = document.createElement('button');
                     btn.className = 'mode-btn';
+                    btn.id = `mode-btn-${mode.id}`;
+                    btn.dataset.mode = mode.id;
                     btn.innerHTML = `${getModeIcon(mode.id)} ${mode.name}`;
                     btn.title = mode.description;
-                    btn.onclick = () => selectMode(mode.id);
                     
                     if (mode.id === currentMode) {
                         btn.classList.add('active');
@@ -585,82 +1023,117 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
         async function loadProfiles() {
             try {
                 const response = await fetch('/api/profiles');
-                const profiles = await response.json();
-                
-                const profilesList = document.getElementById('profilesList');
-                profilesList.innerHTML = '';
-                
-                profiles.forEach(profile => {
-                    const profileBtn = document.createElement('button');
-                    profileBtn.className = 'btn btn-secondary';
-                    profileBtn.style.marginRight = '5px';
-                    profileBtn.style.marginBottom = '5px';
-                    profileBtn.innerHTML = `📁 ${profile}`;
-                    profileBtn.onclick = () => loadProfile(profile);
-                    profilesList.appendChild(profileBtn);
-                });
+                renderProfiles(await response.json());
             } catch (error) {
                 console.error('Failed to load profiles:', error);
             }
         }
         
+        function renderProfiles(profiles) {
+            const profilesList = els.profilesList;
+            const names = new Set(profiles);
+            
+            // Remove buttons for profiles that no longer exist
+            profileButtons.forEach((btn, profile) => {
+                if (!names.has(profile)) {
+                    btn.remove();
+                    profileButtons.delete(profile);
+                }
+            });
+            
+            // Only create buttons for newly added profiles
+            profiles.forEach(profile => {
+                if (profileButtons.has(profile)) return;
+                
+                const profileBtn = document.createElement('button');
+                profileBtn.className = 'btn btn-secondary';
+                profileBtn.style.marginRight = '5px';
+                profileBtn.style.marginBottom = '5px';
+                profileBtn.innerHTML = `📁 ${profile}`;
+                profileBtn.onclick = () => loadProfile(profile);
+                profilesList.appendChild(profileBtn);
+                profileButtons.set(profile, profileBtn);
+            });
+        }
+        
+        function watchStatus() {
+            if (!window.EventSource) return false;
+            
+            // EventSource reconnects by itself if the stream drops
+            const events = new EventSource('/api/events');
+            events.onmessage = (e) => applyStatus(JSON.parse(e.data));
+            return true;
+        }
+        
         async function updateStatus() {
             try {
                 const response = await fetch('/api/status');
-                const status = await response.json();
+                applyStatus(await response.json());
+            } catch (error) {
+                console.error('Failed to update status:', error);
+            }
+        }
+        
+        function applyStatus(status) {
+            // Only touch the status indicator when connectivity or the last write result changes
+            const indicator = `${status.connected}|${status.last_error || ''}`;
+            if (indicator !== lastIndicator) {
+                lastIndicator = indicator;
                 
-                const statusDot = document.getElementById('statusDot');
-                const statusText = document.getElementById('statusText');
+                const statusDot = els.statusDot;
+                const statusText = els.statusText;
                 
-                if (status.connected) {
+                if (status.last_error) {
+                    console.error('Failed to apply settings:', status.last_error);
+                    statusDot.style.background = '#ff4444';
+                    statusText.textContent = `Write failed: ${status.last_error}`;
+                } else if (status.connected) {
                     statusDot.style.background = '#83B81A';
                     statusText.textContent = 'Connected';
                 } else {
                     statusDot.style.background = '#ff4444';
                     statusText.textContent = 'Disconnected';
                 }
-                
-                // Update current state display
-                const mode = rgbModes.find(m => m.id === status.state.mode);
-                if (mode) {
-                    document.getElementById('currentMode').textContent = `${mode.name} Mode`;
-                }
-                document.getElementById('currentBrightness').textContent = `${status.state.brightness}%`;
-                
-                // Update sliders
-                document.getElementById('brightnessSlider').value = status.state.brightness;
-                document.getElementById('brightnessValue').textContent = status.state.brightness;
-                document.getElementById('speedSlider').value = status.state.speed;
-                document.getElementById('speedValue').textContent = status.state.speed;
-                
-                // Update color
+            }
+            
+            // Update current state display
+            const mode = rgbModeById.get(status.state.mode);
+            if (mode) {
+                els.currentMode.textContent = `${mode.name} Mode`;
+            }
+            els.currentBrightness.textContent = `${status.state.brightness}%`;
+            
+            // Update sliders, unless the user is dragging them
+            if (!dragging.has(els.brightnessSlider)) {
+                els.brightnessSlider.value = status.state.brightness;
+                els.brightnessValue.textContent = status.state.brightness;
+            }
+            if (!dragging.has(els.speedSlider)) {
+                els.speedSlider.value = status.state.speed;
+                els.speedValue.textContent = status.state.speed;
+            }
+            
+            // Update color
+            if (!dragging.has(els.colorPicker)) {
                 const [r, g, b] = status.state.color;
-                const hexColor = `#${r.toString(16).padStart(2, '0')}${g.toString(16).padStart(2, '0')}${b.toString(16).padStart(2, '0')}`;
-                document.getElementById('colorPicker').value = hexColor;
-                
-                // Update preview
-                updatePreview(status.state);
-                
-            } catch (error) {
-                console.error('Failed to update status:', error);
+                els.colorPicker.value = rgbToHex(r, g, b);
             }
+            
+            // Update preview
+            updatePreview(status.state);
         }
         
         function updatePreview(state) {
             const [r, g, b] = state.color;
             const brightness = state.brightness / 100;
             
-            const adjustedR = Math.floor(r * brightness);
-            const adjustedG = Math.floor(g * brightness);
-            const adjustedB = Math.floor(b * brightness);
-            
-            const color = `rgb(${adjustedR}, ${adjustedG}, ${adjustedB})`;
+            const color = rgbToHex((r * brightness) | 0, (g * brightness) | 0, (b * brightness) | 0);
             
             // Update zones based on mode
             if (state.mode === 0) {
                 // Static mode - only update selected zone
                 for (let i = 1; i <= 4; i++) {
-                    const zone = document.getElementById(`zone${i}`);
+                    const zone = zoneElements[i - 1];
                     if (i === state.zone) {
                         zone.style.background = color;
                     } else {
@@ -670,34 +1143,50 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
                 }
             } else {
                 // Other modes - update all zones
-                for (let i = 1; i <= 4; i++) {
-                    const zone = document.getElementById(`zone${i}`);
+                for (const zone of zoneElements) {
                     zone.style.background = color;
                 }
             }
         }
         
         function setupEventListeners() {
+            // Mode buttons, one listener for the whole grid
+            els.modeGrid.addEventListener('click', (e) => {
+                const btn = e.target.closest('.mode-btn');
+                if (btn) selectMode(parseInt(btn.dataset.mode));
+            });
+            
+            // Mark each control as dragged from its first input until it is released
+            [els.brightnessSlider, els.speedSlider, els.colorPicker].forEach(el => {
+                el.addEventListener('input', () => dragging.add(el));
+                el.addEventListener('change', () => dragging.delete(el));
+                el.addEventListener('pointerup', () => dragging.delete(el));
+            });
+            window.addEventListener('pointerup', () => dragging.clear());
+            
             // Brightness slider
-            document.getElementById('brightnessSlider').addEventListener('input', (e) => {
-                document.getElementById('brightnessValue').textContent = e.target.value;
-                applySettings();
+            els.brightnessSlider.addEventListener('input', (e) => {
+                els.brightnessValue.textContent = e.target.value;
+                applySettingsSoon();
             });
+            els.brightnessSlider.addEventListener('change', applySettingsSoon.flush);
             
             // Speed slider
-            document.getElementById('speedSlider').addEventListener('input', (e) => {
-                document.getElementById('speedValue').textContent = e.target.value;
-                applySettings();
+            els.speedSlider.addEventListener('input', (e) => {
+                els.speedValue.textContent = e.target.value;
+                applySettingsSoon();
             });
+            els.speedSlider.addEventListener('change', applySettingsSoon.flush);
             
             // Color picker
-            document.getElementById('colorPicker').addEventListener('input', applySettings);
+            els.colorPicker.addEventListener('input', applySettingsSoon);
+            els.colorPicker.addEventListener('change', applySettingsSoon.flush);
             
             // Preset colors
             document.querySelectorAll('.preset-color').forEach(preset => {
                 preset.addEventListener('click', (e) => {
                     const color = e.target.dataset.color;
-                    document.getElementById('colorPicker').value = color;
+                    els.colorPicker.value = color;
                     applySettings();
                 });
             });
@@ -705,9 +1194,10 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
             // Direction buttons
             document.querySelectorAll('.direction-btn').forEach(btn => {
                 btn.addEventListener('click', (e) => {
-                    document.querySelectorAll('.direction-btn').forEach(b => b.classList.remove('active'));
-                    e.target.classList.add('active');
-                    currentDirection = parseInt(e.target.dataset.direction);
+                    const direction = parseInt(e.target.dataset.direction);
+                    if (direction === currentDirection) return; // Already applied
+                    
+                    markActiveDirection(direction);
                     applySettings();
                 });
             });
@@ -715,54 +1205,119 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
             // Zone buttons
             document.querySelectorAll('.zone-btn').forEach(btn => {
                 btn.addEventListener('click', (e) => {
-                    document.querySelectorAll('.zone-btn').forEach(b => b.classList.remove('active'));
-                    e.target.classList.add('active');
-                    currentZone = parseInt(e.target.dataset.zone);
+                    const zone = parseInt(e.target.dataset.zone);
+                    if (zone === currentZone) return; // Already applied
+                    
+                    markActiveZone(zone);
                     applySettings();
                 });
             });
             
             // Set default active states
-            document.querySelector('.direction-btn[data-direction="1"]').classList.add('active');
-            document.querySelector('.zone-btn[data-zone="1"]').classList.add('active');
+            markActiveDirection(currentDirection);
+            markActiveZone(currentZone);
+        }
+        
+        // Keep currentDirection/currentZone and the highlighted button in step
+        function markActiveDirection(direction) {
+            currentDirection = direction;
+            document.querySelectorAll('.direction-btn').forEach(b => {
+                b.classList.toggle('active', parseInt(b.dataset.direction) === direction);
+            });
+        }
+        
+        function markActiveZone(zone) {
+            currentZone = zone;
+            document.querySelectorAll('.zone-btn').forEach(b => {
+                b.classList.toggle('active', parseInt(b.dataset.zone) === zone);
+            });
+        }
+        
+        function markActiveMode(modeId) {
+            const active = els.modeGrid.querySelector('.mode-btn.active');
+            if (active) active.classList.remove('active');
+            
+            const btn = document.getElementById(`mode-btn-${modeId}`);
+            if (btn) btn.classList.add('active');
         }
         
         function selectMode(modeId) {
             currentMode = modeId;
             
             // Update UI
-            document.querySelectorAll('.mode-btn').forEach(btn => btn.classList.remove('active'));
-            event.target.classList.add('active');
+            markActiveMode(modeId);
             
             // Show/hide controls based on mode
-            const mode = rgbModes.find(m => m.id === modeId);
+            const mode = rgbModeById.get(modeId);
             
             // Speed control (all animated modes)
-            document.getElementById('speedGroup').style.display = mode.supports_speed ? 'block' : 'none';
+            els.speedGroup.style.display = mode.supports_speed ? 'block' : 'none';
             
             // Color control (modes that accept color)
-            document.getElementById('colorGroup').style.display = mode.supports_color ? 'block' : 'none';
+            els.colorGroup.style.display = mode.supports_color ? 'block' : 'none';
             
             // Direction control (Wave and Shifting modes)
-            document.getElementById('directionGroup').style.display = (modeId === 3 || modeId === 4) ? 'block' : 'none';
+            els.directionGroup.style.display = (modeId === 3 || modeId === 4) ? 'block' : 'none';
             
             // Zone control (Static mode only)
-            document.getElementById('zoneGroup').style.display = (modeId === 0) ? 'block' : 'none';
+            els.zoneGroup.style.display = (modeId === 0) ? 'block' : 'none';
             
             applySettings();
         }
         
-        async function applySettings() {
-            const brightness = parseInt(document.getElementById('brightnessSlider').value);
-            const speed = parseInt(document.getElementById('speedSlider').value);
-            const colorHex = document.getElementById('colorPicker').value;
+        // Changes made within one animation frame are merged and sent as a single request
+        let pendingSettings = null;
+        
+        function scheduleSend(patch) {
+            const scheduled = pendingSettings !== null;
+            pendingSettings = { ...pendingSettings, ...patch };
+            if (scheduled) return;
+            
+            requestAnimationFrame(() => {
+                const data = pendingSettings;
+                pendingSettings = null;
+                sendSettings(data);
+            });
+        }
+        
+        function applySettings() {
+            scheduleSend(currentSettings());
+        }
+        
+        // Call fn once input has paused for ms; flush() runs a pending call right away
+        function debounce(fn, ms) {
+            let timer = null;
+            
+            const debounced = () => {
+                clearTimeout(timer);
+                timer = setTimeout(() => {
+                    timer = null;
+                    fn();
+                }, ms);
+            };
+            
+            debounced.flush = () => {
+                if (timer === null) return;
+                clearTimeout(timer);
+                timer = null;
+                fn();
+            };
+            
+            return debounced;
+        }
+        
+        // Dragging a slider or the color picker only sends the value it settles on
+        const applySettingsSoon = debounce(applySettings, 50);
+        
+        function currentSettings() {
+            const brightness = parseInt(els.brightnessSlider.value);
+            const speed = parseInt(els.speedSlider.value);
+            const colorHex = els.colorPicker.value;
             
             // Convert hex to RGB
-            const r = parseInt(colorHex.substr(1, 2), 16);
-            const g = parseInt(colorHex.substr(3, 2), 16);
-            const b = parseInt(colorHex.substr(5, 2), 16);
+            const [r, g, b] = hexToRgb(colorHex);
             
-            const data = {
+            return {
                 mode: currentMode,
                 brightness: brightness,
                 speed: speed,
@@ -770,7 +1325,9 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
                 direction: currentDirection,
                 zone: currentZone
             };
-            
+        }
+        
+        async function sendSettings(data) {
             try {
                 const response = await fetch('/api/set_mode', {
                     method: 'POST',
@@ -779,9 +1336,9 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
                 });
                 
                 const result = await response.json();
-                if (result.success) {
+                if (result.success && data.color) {
                     // Update preview immediately
-                    updatePreview({ color: [r, g, b], brightness: brightness });
+                    updatePreview({ color: data.color, brightness: data.brightness });
                 }
             } catch (error) {
                 console.error('Failed to apply settings:', error);
@@ -789,7 +1346,7 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
         }
         
         async function saveProfile() {
-            const name = document.getElementById('profileName').value.trim();
+            const name = els.profileName.value.trim();
             if (!name) {
                 alert('Please enter a profile name');
                 return;
@@ -804,8 +1361,10 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
                 
                 const result = await response.json();
                 if (result.success) {
-                    document.getElementById('profileName').value = '';
-                    await loadProfiles();
+                    els.profileName.value = '';
+                    // The list is left out if the server could not read it back
+                    if (result.profiles) renderProfiles(result.profiles);
+                    else loadProfiles();
                     alert(`Profile "${name}" saved!`);
                 } else {
                     alert('Failed to save profile');
@@ -825,7 +1384,8 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
                 
                 const result = await response.json();
                 if (result.success) {
-                    await updateStatus();
+                    if (result.status) applyStatus(result.status);
+                    else updateStatus();
                     alert(`Profile "${name}" loaded!`);
                 } else {
                     alert('Failed to load profile');
@@ -835,28 +1395,33 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
             }
         }
         
+        const PRESETS = Object.freeze({
+            'acer_green': { mode: 1, color: [131, 184, 26], speed: 5, brightness: 100 },
+            'gaming_red': { mode: 3, color: [255, 0, 0], speed: 7, brightness: 90 },
+            'cool_blue': { mode: 0, color: [0, 100, 255], zone: 1, brightness: 80 },
+            'rainbow': { mode: 2, speed: 6, brightness: 100 },
+            'purple_zoom': { mode: 5, color: [128, 0, 255], speed: 4, brightness: 85 },
+            'turn_off': { brightness: 0 }
+        });
+        
+        const PRESET_NAMES = Object.freeze({
+            'acer_green': 'Acer Green Breathing',
+            'gaming_red': 'Gaming Red Wave',
+            'cool_blue': 'Cool Blue Static',
+            'rainbow': 'Rainbow Neon',
+            'purple_zoom': 'Purple Zoom',
+            'turn_off': 'Turn Off'
+        });
+        
         async function applyPreset(presetName) {
-            const presets = {
-                'acer_green': { mode: 1, color: [131, 184, 26], speed: 5, brightness: 100 },
-                'gaming_red': { mode: 3, color: [255, 0, 0], speed: 7, brightness: 90 },
-                'cool_blue': { mode: 0, color: [0, 100, 255], zone: 1, brightness: 80 },
-                'rainbow': { mode: 2, speed: 6, brightness: 100 },
-                'purple_zoom': { mode: 5, color: [128, 0, 255], speed: 4, brightness: 85 },
-                'turn_off': { brightness: 0 }
-            };
-            
-            const preset = presets[presetName];
+            const preset = PRESETS[presetName];
             if (!preset) return;
             
             try {
                 // Apply the preset
                 if (presetName === 'turn_off') {
                     // Just turn off brightness
-                    const response = await fetch('/api/set_mode', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({ mode: currentMode, brightness: 0 })
-                    });
+                    scheduleSend({ mode: currentMode, brightness: 0 });
                 } else {
                     // Apply full preset
                     const data = {
@@ -868,54 +1433,42 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
                         zone: preset.zone || currentZone
                     };
                     
-                    const response = await fetch('/api/set_mode', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify(data)
-                    });
+                    scheduleSend(data);
                     
                     // Update UI to reflect preset
+                    markActiveZone(data.zone);
+                    
                     if (preset.mode !== undefined) {
                         currentMode = preset.mode;
-                        document.querySelectorAll('.mode-btn').forEach(btn => btn.classList.remove('active'));
-                        document.querySelector(`[onclick*="selectMode(${preset.mode})"]`).classList.add('active');
+                        markActiveMode(preset.mode);
                         
                         // Update control visibility
-                        const mode = rgbModes.find(m => m.id === preset.mode);
-                        document.getElementById('speedGroup').style.display = mode?.supports_speed ? 'block' : 'none';
-                        document.getElementById('colorGroup').style.display = mode?.supports_color ? 'block' : 'none';
-                        document.getElementById('directionGroup').style.display = (preset.mode === 3 || preset.mode === 4) ? 'block' : 'none';
-                        document.getElementById('zoneGroup').style.display = (preset.mode === 0) ? 'block' : 'none';
+                        const mode = rgbModeById.get(preset.mode);
+                        els.speedGroup.style.display = mode?.supports_speed ? 'block' : 'none';
+                        els.colorGroup.style.display = mode?.supports_color ? 'block' : 'none';
+                        els.directionGroup.style.display = (preset.mode === 3 || preset.mode === 4) ? 'block' : 'none';
+                        els.zoneGroup.style.display = (preset.mode === 0) ? 'block' : 'none';
                     }
                     
                     if (preset.color) {
                         const [r, g, b] = preset.color;
-                        const hexColor = `#${r.toString(16).padStart(2, '0')}${g.toString(16).padStart(2, '0')}${b.toString(16).padStart(2, '0')}`;
-                        document.getElementById('colorPicker').value = hexColor;
+                        const hexColor = rgbToHex(r, g, b);
+                        els.colorPicker.value = hexColor;
                     }
                     
                     if (preset.brightness !== undefined) {
-                        document.getElementById('brightnessSlider').value = preset.brightness;
-                        document.getElementById('brightnessValue').textContent = preset.brightness;
+                        els.brightnessSlider.value = preset.brightness;
+                        els.brightnessValue.textContent = preset.brightness;
                     }
                     
                     if (preset.speed !== undefined) {
-                        document.getElementById('speedSlider').value = preset.speed;
-                        document.getElementById('speedValue').textContent = preset.speed;
+                        els.speedSlider.value = preset.speed;
+                        els.speedValue.textContent = preset.speed;
                     }
                 }
                 
                 // Show success message
-                const presetNames = {
-                    'acer_green': 'Acer Green Breathing',
-                    'gaming_red': 'Gaming Red Wave',
-                    'cool_blue': 'Cool Blue Static',
-                    'rainbow': 'Rainbow Neon',
-                    'purple_zoom': 'Purple Zoom',
-                    'turn_off': 'Turn Off'
-                };
-                
-                console.log(`Applied preset: ${presetNames[presetName]}`);
+                console.log(`Applied preset: ${PRESET_NAMES[presetName]}`);
                 
             } catch (error) {
                 console.error('Failed to apply preset:', error);
@@ -925,35 +1478,30 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
         async function applyToAllZones() {
             if (currentMode !== 0) return; // Only works in static mode
             
-            const brightness = parseInt(document.getElementById('brightnessSlider').value);
-            const colorHex = document.getElementById('colorPicker').value;
+            const brightness = parseInt(els.brightnessSlider.value);
+            const colorHex = els.colorPicker.value;
             
             // Convert hex to RGB
-            const r = parseInt(colorHex.substr(1, 2), 16);
-            const g = parseInt(colorHex.substr(3, 2), 16);
-            const b = parseInt(colorHex.substr(5, 2), 16);
-            
-            // Apply to all zones
-            for (let zone = 1; zone <= 4; zone++) {
-                const data = {
-                    mode: 0,
-                    brightness: brightness,
-                    color: [r, g, b],
-                    zone: zone
-                };
-                
-                try {
-                    await fetch('/api/set_mode', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify(data)
-                    });
-                } catch (error) {
-                    console.error(`Failed to apply to zone ${zone}:`, error);
-                }
-            }
+            const [r, g, b] = hexToRgb(colorHex);
+            
+            // Apply to all zones in a single request
+            const data = {
+                mode: 0,
+                brightness: brightness,
+                color: [r, g, b],
+                zones: [1, 2, 3, 4]
+            };
             
-            console.log('Applied color to all zones');
+            try {
+                await fetch('/api/set_all_zones', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify(data)
+                });
+                console.log('Applied color to all zones');
+            } catch (error) {
+                console.error('Failed to apply to all zones:', error);
+            }
         }
         
         // Initialize when page loads
@@ -962,13 +1510,33 @@ class RGBWebHandler(SimpleHTTPRequestHandler):
 </body>
 </html>'''
 
+def build_page():
+    """Render the page once and return its (ETag, gzip encoded body)"""
+    html = minify_html(generate_html()).encode('utf-8')
+    return make_etag(html), gzip.compress(html, compresslevel=9)
+
+# The page never changes at runtime, so render and compress it once at import.
+# Only the gzip copy is kept; the rare client without gzip gets it decompressed
+HTML_ETAG, HTML_GZIP = build_page()
+HTML_GZIP_ETAG = gzip_etag(HTML_ETAG)
+
 def create_handler_class(rgb_controller):
     """Create handler class with RGB controller"""
     class Handler(RGBWebHandler):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, rgb_controller=rgb_controller, **kwargs)
+        pass
+    Handler.rgb_controller = rgb_controller
+    Handler.controller_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rgb-io')
+    Handler.set_mode_queue = SetModeQueue(rgb_controller, Handler.controller_executor,
+                                          Handler.refresh_status)
+    # Read the status ahead of the first poll
+    Handler.schedule_status_refresh()
     return Handler
 
+def open_browser(url, delay=1.0):
+    """Open the web GUI in the default browser after a short delay"""
+    time.sleep(delay)
+    webbrowser.open(url)
+
 def main():
     """Main entry point for web GUI"""
     print("🌐 Starting Acer Predator RGB Web GUI...")
@@ -983,29 +1551,33 @@ def main():
         PORT = 8080
         Handler = create_handler_class(rgb_controller)
         
-        with socketserver.TCPServer(("", PORT), Handler) as httpd:
-            print(f"🚀 Web GUI running at: http://localhost:{PORT}")
-            print(f"📱 Also accessible at: http://127.0.0.1:{PORT}")
-            print("")
-            print("Features:")
-            print("  ✅ All 6 RGB modes (Static, Breath, Neon, Wave, Shifting, Zoom)")
-            print("  ✅ Real-time color picker and sliders")
-            print("  ✅ Live 4-zone keyboard preview")
-            print("  ✅ Profile management (save/load)")
-            print("  ✅ Responsive design for mobile/desktop")
-            print("  ✅ Works in any modern browser")
-            print("")
-            print("🔄 Opening browser automatically...")
-            
-            # Open browser automatically
-            threading.Timer(1.0, lambda: webbrowser.open(f'http://localhost:{PORT}')).start()
-            
-            print("Press Ctrl+C to stop the server")
+        with ThreadingHTTPServer(("", PORT), Handler) as httpd:
+            # Print the whole banner in one write
+            print("\n".join([
+                f"🚀 Web GUI running at: http://localhost:{PORT}",
+                f"📱 Also accessible at: http://127.0.0.1:{PORT}",
+                "",
+                "Features:",
+                "  ✅ All 6 RGB modes (Static, Breath, Neon, Wave, Shifting, Zoom)",
+                "  ✅ Real-time color picker and sliders",
+                "  ✅ Live 4-zone keyboard preview",
+                "  ✅ Profile management (save/load)",
+                "  ✅ Responsive design for mobile/desktop",
+                "  ✅ Works in any modern browser",
+                "",
+                "🔄 Opening browser automatically...",
+                "Press Ctrl+C to stop the server",
+            ]), flush=True)
+            
+            # Open browser automatically once the server is up, without holding up exit
+            threading.Thread(target=open_browser, args=(f'http://localhost:{PORT}',),
+                             name='browser-opener', daemon=True).start()
+            
             httpd.serve_forever()
             
     except KeyboardInterrupt:
         print("\n👋 Web GUI stopped")
-    except Exception as e:
+    except (ImportError, OSError, RuntimeError) as e:
         print(f"❌ Error starting web GUI: {e}")
         return 1
     
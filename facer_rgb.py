@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import argparse
 import json
-from pathlib import Path
+import os
 
 PAYLOAD_SIZE = 16
 CHARACTER_DEVICE = "/dev/acer-gkbbl-0"
@@ -9,9 +9,7 @@ CHARACTER_DEVICE = "/dev/acer-gkbbl-0"
 PAYLOAD_SIZE_STATIC_MODE = 4
 CHARACTER_DEVICE_STATIC = "/dev/acer-gkbbl-static-0"
 
-CONFIG_DIRECTORY = str(Path.home()) + "/.config/predator/saved profiles"
-path = Path(CONFIG_DIRECTORY)
-path.mkdir(parents=True, exist_ok=True)
+CONFIG_DIRECTORY = os.path.expanduser("~") + "/.config/predator/saved profiles"
 
 parser = argparse.ArgumentParser(description=f"""Interacts with experimental Acer-wmi kernel module.
 -m [mode index]
@@ -152,7 +150,11 @@ args = parser.parse_args()
 
 if args.list:
     print("Saved profiles:")
-    for filepath in list(path.glob('*.*')): print(f"\t{filepath.stem}")
+    if os.path.isdir(CONFIG_DIRECTORY):
+        for filename in os.listdir(CONFIG_DIRECTORY):
+            # Skip leftover .json.tmp files from an interrupted save
+            if filename.endswith(".json"):
+                print(f"\t{os.path.splitext(filename)[0]}")
     exit()
 
 if args.load:
@@ -162,14 +164,18 @@ if args.load:
         args = parser.parse_args(namespace=t_args)
 
 if args.save:
-    with open(f"{CONFIG_DIRECTORY}/{args.save}.json", 'wt') as f:
-        vars(args).pop('save')
-        vars(args).pop('load')
-        json.dump(vars(args), f, indent=4)
+    os.makedirs(CONFIG_DIRECTORY, exist_ok=True)
+    profile_path = f"{CONFIG_DIRECTORY}/{args.save}.json"
+    vars(args).pop('save')
+    vars(args).pop('load')
+    # Write a temporary file and swap it in, so an interrupted save never leaves a truncated profile
+    with open(profile_path + ".tmp", 'wt') as f:
+        f.write(json.dumps(vars(args), indent=4))
+    os.replace(profile_path + ".tmp", profile_path)
 
 if args.mode == 0:
     # Static coloring mode
-    payload = [0] * PAYLOAD_SIZE_STATIC_MODE
+    payload = bytearray(PAYLOAD_SIZE_STATIC_MODE)
     if args.zone < 1 or args.zone > 8:
         print("Invalid Zone ID entered! Possible values are: 1, 2, 3, 4 from left to right")
     payload[0] = 1 << (args.zone - 1)
@@ -177,21 +183,21 @@ if args.mode == 0:
     payload[2] = args.green
     payload[3] = args.blue
     with open(CHARACTER_DEVICE_STATIC, 'wb') as cd:
-        cd.write(bytes(payload))
+        cd.write(payload)
 
     # Tell WMI To use STATIC coloring
     # Dynamic coloring mode
-    payload = [0] * PAYLOAD_SIZE
+    payload = bytearray(PAYLOAD_SIZE)
     payload[2] = args.brightness
     payload[9] = 1
     with open(CHARACTER_DEVICE, 'wb') as cd:
-        cd.write(bytes(payload))
+        cd.write(payload)
 
 
 
 else:
     # Dynamic coloring mode
-    payload = [0] * PAYLOAD_SIZE
+    payload = bytearray(PAYLOAD_SIZE)
     payload[0] = args.mode
     payload[1] = args.speed
     payload[2] = args.brightness
@@ -203,4 +209,4 @@ else:
     payload[9] = 1
 
     with open(CHARACTER_DEVICE, 'wb') as cd:
-        cd.write(bytes(payload))
+        cd.write(payload)
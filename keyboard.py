@@ -12,6 +12,18 @@ from time import sleep as sleep
 ) = ([], [], [], [], [], [], [])
 choice = 0
 
+MODE_MENU = (
+    "Choose the RGB Mode"
+    "\n1. Static"
+    "\n2. Breathing"
+    "\n3. Neon"
+    "\n4. Wave"
+    "\n5. Shifting"
+    "\n6. Zoom"
+    "\n7. Re-Run the Last Command"
+    "\n0. Exit"
+)
+
 
 def setup():
     if not (".keyboard_cache" in [f for f in os.listdir(".") if f.startswith(".")]):
@@ -184,54 +196,28 @@ def run():
         file.write(",".join(final_command))
 
 
+# Menu choice -> (facer_rgb.py mode index, prompts to run for that mode)
+MODE_PROMPTS = {
+    1: (0, (zone, color)),
+    2: (1, (speed, bright, color)),
+    3: (2, (speed, bright)),
+    4: (3, (speed, bright, direction)),
+    5: (4, (speed, bright, color, direction)),
+    6: (5, (speed, bright, color)),
+}
+
+
 def mode():
     global mode_choice, choice
-    print("Choose the RGB Mode")
-    print("1. Static")
-    print("2. Breathing")
-    print("3. Neon")
-    print("4. Wave")
-    print("5. Shifting")
-    print("6. Zoom")
-    print("7. Re-Run the Last Command")
-    print("0. Exit")
+    print(MODE_MENU)
     try:
         choice = int(input("Enter your choice: "))
-        if choice == 1:
-            os.system("clear")
-            mode_choice.append(0)
-            zone()
-            color()
-        elif choice == 2:
-            os.system("clear")
-            mode_choice.append(1)
-            speed()
-            bright()
-            color()
-        elif choice == 3:
-            os.system("clear")
-            mode_choice.append(2)
-            speed()
-            bright()
-        elif choice == 4:
-            os.system("clear")
-            mode_choice.append(3)
-            speed()
-            bright()
-            direction()
-        elif choice == 5:
-            os.system("clear")
-            mode_choice.append(4)
-            speed()
-            bright()
-            color()
-            direction()
-        elif choice == 6:
+        if choice in MODE_PROMPTS:
             os.system("clear")
-            mode_choice.append(5)
-            speed()
-            bright()
-            color()
+            mode_index, prompts = MODE_PROMPTS[choice]
+            mode_choice.append(mode_index)
+            for prompt in prompts:
+                prompt()
         elif choice == 7:
             os.system("clear")
             rerun()